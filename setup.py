@@ -0,0 +1,14 @@
+"""
+Builds the optional compiled scoring core (yahtzee_core.pyx).
+Requires Cython; the game runs fine without it.
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="yahtzee",
+    ext_modules=cythonize("yahtzee_core.pyx", language_level=3),
+)
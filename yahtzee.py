@@ -9,7 +9,8 @@ At the end of 13 rounds, displays final scores for each player and offers a repl
 import pygame
 import sys
 import random
-from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 # ---------------------------------------------------------------------------
 #                               CONSTANTS
@@ -34,8 +35,15 @@ MAX_ROLLS_PER_TURN = 2     # Each turn, a player can roll up to 2 extra times af
 #                               PYGAME SETUP
 # ---------------------------------------------------------------------------
 pygame.init()
-screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+# Double buffering lets SDL pick a faster page-flip path where available
+screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.DOUBLEBUF)
 pygame.display.set_caption("Yahtzee")
+
+# The game only reacts to these event types; filtering in event.get keeps
+# the Python-side dispatch loops from walking everything else. Mouse motion
+# alone can flood the queue, so it is blocked at the SDL level outright.
+HANDLED_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+pygame.event.set_blocked(pygame.MOUSEMOTION)
 clock = pygame.time.Clock()
 
 # Fonts
@@ -57,6 +65,30 @@ for i in range(6):
     face_surf = dice_image.subsurface(face_rect)
     dice_faces.append(face_surf)
 
+# Half-size dice faces for the scorecard screen, scaled once at load time
+HALF_DICE_FACES = [
+    pygame.transform.scale(face, (DICE_FACE_WIDTH // 2, DICE_FACE_HEIGHT // 2))
+    for face in dice_faces
+]
+
+# Cache of dice faces scaled for the cup animation, keyed by (face index, w, h).
+# The animation only uses a handful of discrete sizes, so this stays small.
+_scaled_face_cache = {}
+
+def get_scaled_face(face_index, w, h):
+    """
+    Returns dice_faces[face_index] scaled to (w, h), caching the result so
+    each distinct size is only resampled once.
+    """
+    if w == DICE_FACE_WIDTH and h == DICE_FACE_HEIGHT:
+        return dice_faces[face_index]
+    key = (face_index, w, h)
+    scaled = _scaled_face_cache.get(key)
+    if scaled is None:
+        scaled = pygame.transform.scale(dice_faces[face_index], (w, h))
+        _scaled_face_cache[key] = scaled
+    return scaled
+
 # --- Load and scale cup sprite sheet ---
 cup_image = pygame.image.load("dice-cup.png").convert_alpha()
 CUP_FRAME_COUNT = 4
@@ -91,36 +123,63 @@ dice_positions = [
     (700, 250),
 ]
 
-# Each player's scoreboard is a dictionary of category -> score (or None).
-scoreboards = []  # List of dicts; one per player
-
-# ---------------------------------------------------------------------------
-#                       INITIALIZE SCOREBOARDS
-# ---------------------------------------------------------------------------
-def init_scoreboards(num_players):
+# Hit-test rects for the dice; positions are fixed, so build the rects once
+DICE_RECTS = [pygame.Rect(x, y, DICE_FACE_WIDTH, DICE_FACE_HEIGHT)
+              for (x, y) in dice_positions]
+
+# Red "kept" outline, pre-rendered once so marking a die is a blit instead
+# of a rect draw (kept dice are always shown at full size)
+DICE_OUTLINE_SURF = pygame.Surface((DICE_FACE_WIDTH, DICE_FACE_HEIGHT), pygame.SRCALPHA)
+pygame.draw.rect(DICE_OUTLINE_SURF, RED, DICE_OUTLINE_SURF.get_rect(), 3)
+
+# The white status box at the top of the rolling screen
+STATUS_BOX_RECT = pygame.Rect((WINDOW_WIDTH - 600) // 2, 20, 600, 150)
+
+# Rolling-screen background (green fill plus the status box), rendered once
+# so each frame starts from a single blit instead of a fill + rect draws
+ROLLING_BG = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+ROLLING_BG.fill(GREEN)
+pygame.draw.rect(ROLLING_BG, WHITE, STATUS_BOX_RECT)
+pygame.draw.rect(ROLLING_BG, BLACK, STATUS_BOX_RECT, 2)
+
+# Scoring categories in scorecard order; the first six form the upper section
+CATEGORIES = (
+    "ones", "twos", "threes", "fours", "fives", "sixes",
+    "three_of_a_kind", "four_of_a_kind", "full_house",
+    "small_straight", "large_straight", "yahtzee", "chance",
+)
+UPPER_CATEGORIES = CATEGORIES[:6]
+LOWER_CATEGORIES = CATEGORIES[6:]
+
+# Straight masks for scoring: bit d set means at least one die shows d.
+# A small straight is any four consecutive values; a large straight is
+# exactly five consecutive values, so it matches the whole mask.
+SMALL_STRAIGHT_MASKS = (0b0011110, 0b0111100, 0b1111000)  # 1-4, 2-5, 3-6
+LARGE_STRAIGHT_MASKS = (0b0111110, 0b1111100)             # 1-5, 2-6
+
+# ---------------------------------------------------------------------------
+#                               GAME STATE
+# ---------------------------------------------------------------------------
+@dataclass
+class GameState:
     """
-    Create and initialize a scoreboard (dict) for each player with None values
-    for each scoring category.
+    State for one game: the player count and a scoreboard dict per player
+    (category -> score, or None while unscored). Passed explicitly through
+    the game functions instead of living in module globals.
     """
-    global scoreboards
-    scoreboards = []
-    for _ in range(num_players):
-        sb = {
-            "ones": None,
-            "twos": None,
-            "threes": None,
-            "fours": None,
-            "fives": None,
-            "sixes": None,
-            "three_of_a_kind": None,
-            "four_of_a_kind": None,
-            "full_house": None,
-            "small_straight": None,
-            "large_straight": None,
-            "yahtzee": None,
-            "chance": None
-        }
-        scoreboards.append(sb)
+    num_players: int
+    scoreboards: list = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.scoreboards:
+            self.scoreboards = [dict.fromkeys(CATEGORIES)
+                                for _ in range(self.num_players)]
+
+    def reset(self):
+        """Clear all scoreboards in place for a replay."""
+        for sb in self.scoreboards:
+            for k in CATEGORIES:
+                sb[k] = None
 
 # ---------------------------------------------------------------------------
 #                       PROMPT NUMBER OF PLAYERS
@@ -138,20 +197,6 @@ def prompt_player_count():
     box_width, box_height = 700, 150
 
     while True:
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                # If a number key 1-9 is pressed, update chosen_number
-                if pygame.K_1 <= event.key <= pygame.K_9:
-                    chosen_number = event.key - pygame.K_0  # Convert key to number
-                    waiting_for_enter = True
-                elif waiting_for_enter and event.key == pygame.K_RETURN:
-                    if chosen_number is not None:
-                        return chosen_number
-
         # Drawing the prompt screen
         screen.fill(BROWN)
         box_x = (WINDOW_WIDTH - box_width) // 2
@@ -168,31 +213,65 @@ def prompt_player_count():
         draw_text(prompt_text, box_x + box_width//2, box_y + box_height//2, RED, center=True, font_obj=font)
 
         pygame.display.flip()
-        clock.tick(FPS)
+
+        # The screen is static between key presses, so block until input
+        # arrives instead of spinning at FPS
+        events = [pygame.event.wait()] + pygame.event.get(HANDLED_EVENT_TYPES)
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN:
+                # If a number key 1-9 is pressed, update chosen_number
+                if pygame.K_1 <= event.key <= pygame.K_9:
+                    chosen_number = event.key - pygame.K_0  # Convert key to number
+                    waiting_for_enter = True
+                elif waiting_for_enter and event.key == pygame.K_RETURN:
+                    if chosen_number is not None:
+                        return chosen_number
 
 # ---------------------------------------------------------------------------
 #                               ROLL DICE
 # ---------------------------------------------------------------------------
+_DIE_FACES = (1, 2, 3, 4, 5, 6)
+
 def roll_dice(dice_kept, dice_values):
     """
     Roll dice that are not kept (dice_kept[i] == False).
     Each rolled die gets a random value from 1-6.
     Returns updated dice_values list.
     """
-    for i in range(NUM_DICE):
-        if not dice_kept[i]:
-            dice_values[i] = random.randint(1, 6)
+    # random.choices draws all values in one C-level call, which is cheaper
+    # than calling random.randint once per die
+    unkept = [i for i in range(NUM_DICE) if not dice_kept[i]]
+    if unkept:
+        rolls = random.choices(_DIE_FACES, k=len(unkept))
+        for j, i in enumerate(unkept):
+            dice_values[i] = rolls[j]
     return dice_values
 
 # ---------------------------------------------------------------------------
 #                           HELPER DRAW FUNCTIONS
 # ---------------------------------------------------------------------------
+# Cache of rendered text surfaces keyed by (font, text, color). Most strings
+# drawn each frame are static labels, so re-rasterizing them is wasted work.
+_text_cache = {}
+_TEXT_CACHE_MAX = 256
+
 def draw_text(text, x, y, color=BLACK, center=False, font_obj=font):
     """
     Renders text onto the screen at (x, y).
     If center=True, draws the text centered at (x, y).
+    Rendered surfaces are cached so repeated strings are just a blit.
     """
-    text_surface = font_obj.render(text, True, color)
+    key = (id(font_obj), text, color)
+    text_surface = _text_cache.get(key)
+    if text_surface is None:
+        text_surface = font_obj.render(text, True, color)
+        if len(_text_cache) >= _TEXT_CACHE_MAX:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del _text_cache[next(iter(_text_cache))]
+        _text_cache[key] = text_surface
     if center:
         rect = text_surface.get_rect(center=(x, y))
         screen.blit(text_surface, rect)
@@ -213,40 +292,67 @@ def draw_dashed_line(surface, color, start_pos, end_pos, width=1, dash_length=10
 # ---------------------------------------------------------------------------
 #                       CALCULATE POSSIBLE SCORES
 # ---------------------------------------------------------------------------
-def calculate_possible_scores(dice_values):
+def _calc_scores_py(sorted_dice):
     """
-    Given a list of 5 dice values, calculates all possible scores for each category,
-    and returns a dictionary of category -> possible score.
+    Scoring core, keyed by a sorted tuple of dice values so equivalent rolls
+    share one cache entry (only 252 distinct multisets of 5 dice exist).
+
+    Uses a single counting pass plus a bitmask of which values are present
+    (bit d set means at least one die shows d), so straights become simple
+    mask comparisons instead of set operations.
     """
-    counts = Counter(dice_values)
+    counts = [0] * 7  # counts[d] = how many dice show value d (index 0 unused)
+    mask = 0
+    total = 0
+    for d in sorted_dice:
+        counts[d] += 1
+        mask |= 1 << d
+        total += d
+    max_count = max(counts)
+
     score_dict = {}
 
     # Upper section
-    score_dict["ones"]   = sum(d for d in dice_values if d == 1)
-    score_dict["twos"]   = sum(d for d in dice_values if d == 2)
-    score_dict["threes"] = sum(d for d in dice_values if d == 3)
-    score_dict["fours"]  = sum(d for d in dice_values if d == 4)
-    score_dict["fives"]  = sum(d for d in dice_values if d == 5)
-    score_dict["sixes"]  = sum(d for d in dice_values if d == 6)
+    score_dict["ones"]   = counts[1] * 1
+    score_dict["twos"]   = counts[2] * 2
+    score_dict["threes"] = counts[3] * 3
+    score_dict["fours"]  = counts[4] * 4
+    score_dict["fives"]  = counts[5] * 5
+    score_dict["sixes"]  = counts[6] * 6
 
     # Lower section
-    score_dict["three_of_a_kind"] = sum(dice_values) if any(count >= 3 for count in counts.values()) else 0
-    score_dict["four_of_a_kind"]  = sum(dice_values) if any(count >= 4 for count in counts.values()) else 0
-    score_dict["full_house"]      = 25 if sorted(counts.values()) == [2, 3] else 0
+    score_dict["three_of_a_kind"] = total if max_count >= 3 else 0
+    score_dict["four_of_a_kind"]  = total if max_count >= 4 else 0
+    sorted_counts = sorted(counts[1:], reverse=True)
+    score_dict["full_house"] = 25 if sorted_counts[0] == 3 and sorted_counts[1] == 2 else 0
 
-    unique_vals = set(dice_values)
-    small_straights = [{1, 2, 3, 4}, {2, 3, 4, 5}, {3, 4, 5, 6}]
-    score_dict["small_straight"] = 30 if any(s.issubset(unique_vals) for s in small_straights) else 0
+    # Straights: compare against the precomputed mask constants
+    score_dict["small_straight"] = 30 if any((mask & m) == m for m in SMALL_STRAIGHT_MASKS) else 0
+    score_dict["large_straight"] = 40 if mask in LARGE_STRAIGHT_MASKS else 0
 
-    large_straights = [{1, 2, 3, 4, 5}, {2, 3, 4, 5, 6}]
-    # Also ensure there are exactly 5 unique values
-    score_dict["large_straight"] = 40 if any(s == unique_vals for s in large_straights) and len(unique_vals) == 5 else 0
-
-    score_dict["yahtzee"] = 50 if any(count == 5 for count in counts.values()) else 0
-    score_dict["chance"]  = sum(dice_values)
+    score_dict["yahtzee"] = 50 if max_count == 5 else 0
+    score_dict["chance"]  = total
 
     return score_dict
 
+try:
+    # Optional Cython scoring core; build with `python setup.py build_ext --inplace`
+    from yahtzee_core import calc_scores as _calc_scores_impl
+except ImportError:
+    _calc_scores_impl = _calc_scores_py
+
+_calc_scores_cached = lru_cache(maxsize=512)(_calc_scores_impl)
+
+def calculate_possible_scores(dice_values):
+    """
+    Given a list of 5 dice values, calculates all possible scores for each category,
+    and returns a dictionary of category -> possible score.
+    Results are memoized on the sorted dice, so repeated calls with the same
+    roll (e.g. every scorecard frame) are just a cache lookup.
+    """
+    # Copy the cached dict so callers can't mutate the cached entry
+    return dict(_calc_scores_cached(tuple(sorted(dice_values))))
+
 # ---------------------------------------------------------------------------
 #                  CUP ANIMATION FOR ROLLING DICE
 # ---------------------------------------------------------------------------
@@ -271,30 +377,32 @@ def animate_cup_shake(dice_kept, dice_values):
     # Final positions (where dice originally were)
     final_positions = [list(dice_positions[i]) for i in range(NUM_DICE)]
 
+    # Only the unkept dice move; kept dice stay put for the whole animation
+    unkept = [i for i in range(NUM_DICE) if not dice_kept[i]]
+
     # Move the dice in
     steps_in = 15
-    for step in range(steps_in):
-        for event in pygame.event.get():
+    fracs_in = [(step + 1) / steps_in for step in range(steps_in)]
+    for frac in fracs_in:
+        for event in pygame.event.get(HANDLED_EVENT_TYPES):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
-        frac = (step + 1) / steps_in
-        for i in range(NUM_DICE):
-            if not dice_kept[i]:
-                sx, sy = start_positions[i]
-                start_positions[i][0] = sx + (target_x - sx) * frac
-                start_positions[i][1] = sy + (target_y - sy) * frac
-                dice_scales[i] = 1.0 - 0.5 * frac
+        for i in unkept:
+            sx, sy = start_positions[i]
+            start_positions[i][0] = sx + (target_x - sx) * frac
+            start_positions[i][1] = sy + (target_y - sy) * frac
+            dice_scales[i] = 1.0 - 0.5 * frac
 
         draw_rolling_scene(dice_values, dice_kept, scaled_cup_frames[0],
                            (cup_x, cup_y), start_positions, dice_scales)
-        clock.tick(FPS)
+        clock.tick_busy_loop(FPS)
 
     # Shake the cup (cycling through cup frames)
     shake_frames = 36
     for frame_idx in range(shake_frames):
-        for event in pygame.event.get():
+        for event in pygame.event.get(HANDLED_EVENT_TYPES):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -302,37 +410,35 @@ def animate_cup_shake(dice_kept, dice_values):
         cup_frame = scaled_cup_frames[frame_idx % CUP_FRAME_COUNT]
         draw_rolling_scene(dice_values, dice_kept, cup_frame,
                            (cup_x, cup_y), start_positions, dice_scales, skip_unkept=True)
-        clock.tick(FPS)
+        clock.tick_busy_loop(FPS)
 
     # Roll the unkept dice
     roll_dice(dice_kept, dice_values)
 
     # Move the dice back out
     steps_out = 15
-    for i in range(NUM_DICE):
-        if not dice_kept[i]:
-            start_positions[i][0] = target_x
-            start_positions[i][1] = target_y
-            dice_scales[i] = 0.5
-
-    for step in range(steps_out):
-        for event in pygame.event.get():
+    fracs_out = [(step + 1) / steps_out for step in range(steps_out)]
+    for i in unkept:
+        start_positions[i][0] = target_x
+        start_positions[i][1] = target_y
+        dice_scales[i] = 0.5
+
+    for frac in fracs_out:
+        for event in pygame.event.get(HANDLED_EVENT_TYPES):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
-        frac = (step + 1) / steps_out
-        for i in range(NUM_DICE):
-            if not dice_kept[i]:
-                sx, sy = start_positions[i]
-                fx, fy = final_positions[i]
-                start_positions[i][0] = sx + (fx - sx) * frac
-                start_positions[i][1] = sy + (fy - sy) * frac
-                dice_scales[i] = 0.5 + 0.5 * frac
+        for i in unkept:
+            sx, sy = start_positions[i]
+            fx, fy = final_positions[i]
+            start_positions[i][0] = sx + (fx - sx) * frac
+            start_positions[i][1] = sy + (fy - sy) * frac
+            dice_scales[i] = 0.5 + 0.5 * frac
 
         draw_rolling_scene(dice_values, dice_kept, scaled_cup_frames[0],
                            (cup_x, cup_y), start_positions, dice_scales)
-        clock.tick(FPS)
+        clock.tick_busy_loop(FPS)
 
 # ---------------------------------------------------------------------------
 #                     DRAW DICE/CUP SCENE (ROLLING SCREEN)
@@ -344,21 +450,15 @@ def draw_rolling_scene(dice_values, dice_kept, cup_frame, cup_pos,
     the dice in their current positions, and the cup sprite.
     If skip_unkept=True, unkept dice are not drawn (used during cup shaking).
     """
-    screen.fill(GREEN)
-
-    # A white box at the top with a border
-    box_width, box_height = 600, 150
-    box_x = (WINDOW_WIDTH - box_width) // 2
-    box_y = 20
-    pygame.draw.rect(screen, WHITE, (box_x, box_y, box_width, box_height))
-    pygame.draw.rect(screen, BLACK, (box_x, box_y, box_width, box_height), 2)
+    screen.blit(ROLLING_BG, (0, 0))
 
     # Some text inside that box
-    text_x = box_x + 20
-    text_y = box_y + 20
+    text_x = STATUS_BOX_RECT.x + 20
+    text_y = STATUS_BOX_RECT.y + 20
     draw_text("Rolling Dice...", text_x, text_y, font_obj=small_font)
 
-    # Draw the dice
+    # Draw the dice in one batched blits() call
+    dice_blits = []
     for i in range(NUM_DICE):
         if skip_unkept and not dice_kept[i]:
             continue  # Skip drawing unkept dice
@@ -366,17 +466,18 @@ def draw_rolling_scene(dice_values, dice_kept, cup_frame, cup_pos,
         x, y = current_dice_positions[i]
         scale = dice_scales[i]
 
-        # Scale the dice image
+        # Scale the dice image (cached per distinct size)
         w = int(DICE_FACE_WIDTH * scale)
         h = int(DICE_FACE_HEIGHT * scale)
-        scaled_face = pygame.transform.scale(dice_faces[die_value - 1], (w, h))
+        scaled_face = get_scaled_face(die_value - 1, w, h)
         face_rect = scaled_face.get_rect(center=(x, y))
-        screen.blit(scaled_face, face_rect.topleft)
+        dice_blits.append((scaled_face, face_rect.topleft))
 
-        # Draw a red outline if the die is kept
+        # Kept dice get a red outline on top (kept dice are never scaled)
         if dice_kept[i]:
-            outline_rect = pygame.Rect(face_rect.topleft, (w, h))
-            pygame.draw.rect(screen, RED, outline_rect, 3)
+            dice_blits.append((DICE_OUTLINE_SURF, face_rect.topleft))
+
+    screen.blits(dice_blits)
 
     # Draw the cup
     screen.blit(cup_frame, cup_pos)
@@ -385,7 +486,7 @@ def draw_rolling_scene(dice_values, dice_kept, cup_frame, cup_pos,
 # ---------------------------------------------------------------------------
 #                      DISPLAY SCORECARD & CHOOSE CATEGORY
 # ---------------------------------------------------------------------------
-def display_scorecard_options(dice_values, current_player, round_num):
+def display_scorecard_options(dice_values, current_player, round_num, state):
     """
     Display all scoring categories to the current player based on dice_values.
     The player can press a key to select a category. If [0] is pressed first,
@@ -415,16 +516,82 @@ def display_scorecard_options(dice_values, current_player, round_num):
         ("chance",          "Press [G] for Chance", pygame.K_g)
     ]
 
-    current_scoreboard = scoreboards[current_player]
+    current_scoreboard = state.scoreboards[current_player]
+    needs_redraw = True  # Draw once up front, then only after input
+
+    # The prompt labels never change during a turn, so render them once
+    prompt_surfs = [small_font.render(prompt, True, BLACK)
+                    for _, prompt, _ in cat_key_map]
+
+    # Same for the header; its rect also positions the dashed divider
+    header_text = f"Player {current_player+1} Scorecard - Round {round_num} of {MAX_TURNS}"
+    header_surface = font.render(header_text, True, RED)
+    header_rect = header_surface.get_rect(center=(WINDOW_WIDTH//2, 30))
+    line_y = header_rect.bottom + 5
 
     while chosen_category is None:
-        # Handle events
-        for event in pygame.event.get():
+        # Drawing the scorecard screen (only when something changed)
+        if needs_redraw:
+            screen.fill(BROWN)
+
+            # Header
+            screen.blit(header_surface, header_rect)
+            draw_dashed_line(screen, BLACK, (50, line_y), (WINDOW_WIDTH-50, line_y), width=2, dash_length=10)
+
+            # Zero mode info
+            if zero_mode:
+                draw_text("ZERO MODE ACTIVE: Choose category to assign 0",
+                          WINDOW_WIDTH//2, 66, RED, center=True, font_obj=small_font)
+            else:
+                draw_text("Press [0] to take a 0 on a category",
+                          WINDOW_WIDTH//2, 66, RED, center=True, font_obj=small_font)
+
+            # Display category prompts and possible scores
+            x_prompt = 50
+            x_score = 600
+            y_offset = 80
+            line_height = 40
+
+            for i, (cat, prompt, key) in enumerate(cat_key_map):
+                if current_scoreboard[cat] is not None:
+                    score_text = f"USED (Score: {current_scoreboard[cat]})"
+                else:
+                    if cat in ["three_of_a_kind", "four_of_a_kind", "full_house",
+                               "small_straight", "large_straight", "yahtzee"]:
+                        if possible_scores[cat] == 0:
+                            score_text = "Not eligible"
+                        else:
+                            score_text = f"Possible Score = {possible_scores[cat]}"
+                    else:
+                        score_text = f"Possible Score = {possible_scores[cat]}"
+
+                screen.blit(prompt_surfs[i], (x_prompt, y_offset))
+                draw_text(score_text, x_score, y_offset, font_obj=small_font)
+                y_offset += line_height
+
+            # Show the dice
+            half_w = DICE_FACE_WIDTH // 2
+            half_h = DICE_FACE_HEIGHT // 2
+            total_w = NUM_DICE * half_w + (NUM_DICE - 1) * 20
+            start_x = (WINDOW_WIDTH - total_w) // 2
+            y_dice = WINDOW_HEIGHT - half_h - 20
+
+            screen.blits([(HALF_DICE_FACES[dice_values[i]-1],
+                           (start_x + i * (half_w + 20), y_dice))
+                          for i in range(NUM_DICE)])
+
+            pygame.display.flip()
+            needs_redraw = False
+
+        # Block until input arrives; the scorecard is static between events
+        events = [pygame.event.wait()] + pygame.event.get(HANDLED_EVENT_TYPES)
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
             if event.type == pygame.KEYDOWN:
+                needs_redraw = True
                 # Check for zero-mode toggle
                 if event.key == pygame.K_0:
                     zero_mode = True
@@ -445,79 +612,22 @@ def display_scorecard_options(dice_values, current_player, round_num):
                             else:
                                 chosen_category = cat
 
-        # Drawing the scorecard screen
-        screen.fill(BROWN)
-
-        # Header
-        header_text = f"Player {current_player+1} Scorecard - Round {round_num} of {MAX_TURNS}"
-        draw_text(header_text, WINDOW_WIDTH//2, 30, RED, center=True, font_obj=font)
-        header_surface = font.render(header_text, True, RED)
-        header_rect = header_surface.get_rect(center=(WINDOW_WIDTH//2, 30))
-        line_y = header_rect.bottom + 5
-        draw_dashed_line(screen, BLACK, (50, line_y), (WINDOW_WIDTH-50, line_y), width=2, dash_length=10)
-
-        # Zero mode info
-        if zero_mode:
-            draw_text("ZERO MODE ACTIVE: Choose category to assign 0",
-                      WINDOW_WIDTH//2, 66, RED, center=True, font_obj=small_font)
-        else:
-            draw_text("Press [0] to take a 0 on a category",
-                      WINDOW_WIDTH//2, 66, RED, center=True, font_obj=small_font)
-
-        # Display category prompts and possible scores
-        x_prompt = 50
-        x_score = 600
-        y_offset = 80
-        line_height = 40
-
-        for cat, prompt, key in cat_key_map:
-            if current_scoreboard[cat] is not None:
-                score_text = f"USED (Score: {current_scoreboard[cat]})"
-            else:
-                if cat in ["three_of_a_kind", "four_of_a_kind", "full_house",
-                           "small_straight", "large_straight", "yahtzee"]:
-                    if possible_scores[cat] == 0:
-                        score_text = "Not eligible"
-                    else:
-                        score_text = f"Possible Score = {possible_scores[cat]}"
-                else:
-                    score_text = f"Possible Score = {possible_scores[cat]}"
-
-            draw_text(prompt, x_prompt, y_offset, font_obj=small_font)
-            draw_text(score_text, x_score, y_offset, font_obj=small_font)
-            y_offset += line_height
-
-        # Show the dice
-        half_w = DICE_FACE_WIDTH // 2
-        half_h = DICE_FACE_HEIGHT // 2
-        total_w = NUM_DICE * half_w + (NUM_DICE - 1) * 20
-        start_x = (WINDOW_WIDTH - total_w) // 2
-        y_dice = WINDOW_HEIGHT - half_h - 20
-
-        for i in range(NUM_DICE):
-            scaled_die = pygame.transform.scale(dice_faces[dice_values[i]-1], (half_w, half_h))
-            x = start_x + i * (half_w + 20)
-            screen.blit(scaled_die, (x, y_dice))
-
-        pygame.display.flip()
-        clock.tick(FPS)
-
     return chosen_category, zero_selected
 
 # ---------------------------------------------------------------------------
 #                 APPLY SCORE TO SELECTED CATEGORY
 # ---------------------------------------------------------------------------
-def apply_score_to_category(category, dice_values, current_player, zero_selected=False):
+def apply_score_to_category(category, dice_values, current_player, state, zero_selected=False):
     """
-    Apply the dice_values to the chosen category in the scoreboard.
+    Apply the dice_values to the chosen category in the player's scoreboard.
     If zero_selected is True, that category is assigned 0 points.
     Otherwise, the category is assigned the calculated possible score.
     """
     if zero_selected:
-        scoreboards[current_player][category] = 0
+        state.scoreboards[current_player][category] = 0
     else:
         scores = calculate_possible_scores(dice_values)
-        scoreboards[current_player][category] = scores[category]
+        state.scoreboards[current_player][category] = scores[category]
 
 # ---------------------------------------------------------------------------
 #                         CALCULATE FINAL SCORES
@@ -531,12 +641,8 @@ def calculate_final_score(current_scoreboard):
     - Grand total
     Returns a tuple: (upper_score, bonus, lower_score, total_score).
     """
-    upper_keys = ["ones", "twos", "threes", "fours", "fives", "sixes"]
-    lower_keys = ["three_of_a_kind", "four_of_a_kind", "full_house",
-                  "small_straight", "large_straight", "yahtzee", "chance"]
-
-    upper_score = sum(current_scoreboard[k] for k in upper_keys if current_scoreboard[k] is not None)
-    lower_score = sum(current_scoreboard[k] for k in lower_keys if current_scoreboard[k] is not None)
+    upper_score = sum(current_scoreboard[k] for k in UPPER_CATEGORIES if current_scoreboard[k] is not None)
+    lower_score = sum(current_scoreboard[k] for k in LOWER_CATEGORIES if current_scoreboard[k] is not None)
     bonus = 35 if upper_score >= 63 else 0
     total = upper_score + bonus + lower_score
     return upper_score, bonus, lower_score, total
@@ -544,14 +650,15 @@ def calculate_final_score(current_scoreboard):
 # ---------------------------------------------------------------------------
 #                       GAME OVER / FINAL SCORES SCREEN
 # ---------------------------------------------------------------------------
-def game_over_screen():
+def game_over_screen(state):
     """
     Displays the final scores for all players.
-    Shows a "Play Again" button, which, when clicked, resets the scoreboards and restarts the game.
+    Shows a "Play Again" button; returns when it is clicked so the caller
+    can start a fresh game.
     """
     # Compute final results
     results = []
-    for i, sb in enumerate(scoreboards):
+    for i, sb in enumerate(state.scoreboards):
         upper, bonus, lower, total = calculate_final_score(sb)
         results.append((i+1, upper, bonus, lower, total))
 
@@ -565,83 +672,115 @@ def game_over_screen():
     button_x = (WINDOW_WIDTH - button_width) // 2
     button_y = box_y + box_height + 20
 
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+    # The scores are final, so the whole screen is drawn exactly once
+    screen.fill(BROWN)
+    pygame.draw.rect(screen, WHITE, (box_x, box_y, box_width, box_height))
+    pygame.draw.rect(screen, BLACK, (box_x, box_y, box_width, box_height), 2)
 
-            # If the "Play Again" button is clicked
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mouse_x, mouse_y = event.pos
-                button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-                if button_rect.collidepoint(mouse_x, mouse_y):
-                    # Reset the scoreboards and restart
-                    for key in range(len(scoreboards)):
-                        scoreboards[key] = {k: None for k in scoreboards[key]}
-                    main()
-
-        # Draw final scores screen
-        screen.fill(BROWN)
-        pygame.draw.rect(screen, WHITE, (box_x, box_y, box_width, box_height))
-        pygame.draw.rect(screen, BLACK, (box_x, box_y, box_width, box_height), 2)
+    # Title
+    draw_text("Game Over!", box_x + box_width//2, box_y + 30, RED, center=True, font_obj=font)
 
-        # Title
-        draw_text("Game Over!", box_x + box_width//2, box_y + 30, RED, center=True, font_obj=font)
+    # Table header
+    y_line = box_y + 70
+    draw_text("Player   Upper   Bonus   Lower   Total", box_x + box_width//2, y_line, BLACK,
+              center=True, font_obj=small_font)
+    y_line += 30
 
-        # Table header
-        y_line = box_y + 70
-        draw_text("Player   Upper   Bonus   Lower   Total", box_x + box_width//2, y_line, BLACK,
-                  center=True, font_obj=small_font)
+    # Player results
+    for player_num, upper, bonus, lower, total in results:
+        line = f"P{player_num}:     {upper}      {bonus}      {lower}     {total}"
+        draw_text(line, box_x + 20, y_line, BLACK, font_obj=small_font)
         y_line += 30
 
-        # Player results
-        for player_num, upper, bonus, lower, total in results:
-            line = f"P{player_num}:     {upper}      {bonus}      {lower}     {total}"
-            draw_text(line, box_x + 20, y_line, BLACK, font_obj=small_font)
-            y_line += 30
+    # "Play Again" button
+    pygame.draw.rect(screen, WHITE, (button_x, button_y, button_width, button_height))
+    pygame.draw.rect(screen, BLACK, (button_x, button_y, button_width, button_height), 2)
+    draw_text("Play Again", button_x + button_width//2, button_y + button_height//2,
+              RED, center=True, font_obj=font)
 
-        # "Play Again" button
-        pygame.draw.rect(screen, WHITE, (button_x, button_y, button_width, button_height))
-        pygame.draw.rect(screen, BLACK, (button_x, button_y, button_width, button_height), 2)
-        draw_text("Play Again", button_x + button_width//2, button_y + button_height//2,
-                  RED, center=True, font_obj=font)
+    pygame.display.flip()
 
-        pygame.display.flip()
-        clock.tick(FPS)
+    button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
+    while True:
+        # Nothing left to draw; just wait for quit or the button
+        events = [pygame.event.wait()] + pygame.event.get(HANDLED_EVENT_TYPES)
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            # If the "Play Again" button is clicked
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if button_rect.collidepoint(event.pos):
+                    return
 
 # ---------------------------------------------------------------------------
 #                                MAIN GAME LOOP
 # ---------------------------------------------------------------------------
-def main():
+def play_game(state):
     """
-    Main game function that runs through each turn for all players,
-    handles dice rolling and category scoring, and then shows the game-over screen.
+    Runs one full game: each player takes a turn per round for MAX_TURNS
+    rounds, handling dice rolling and category scoring.
     """
-    # Ask for number of players and initialize their scoreboards
-    num_players = prompt_player_count()
-    init_scoreboards(num_players)
-
     # Each round: each player takes a turn
     for round_num in range(1, MAX_TURNS + 1):
-        for current_player in range(num_players):
+        for current_player in range(state.num_players):
             # Initialize dice for this turn
             dice_values = [0] * NUM_DICE
             dice_kept = [False] * NUM_DICE
             rolls_left = MAX_ROLLS_PER_TURN
             turn_ended = False
+            needs_redraw = True  # Draw once up front, then only after input
 
             # First roll
             dice_values = roll_dice(dice_kept, dice_values)
 
+            # Status-box text is fixed for the turn apart from the rolls-left
+            # counter, so render every variant once up front
+            header_surf = small_font.render(
+                f"Player {current_player+1} - Round {round_num} of {MAX_TURNS}", True, RED)
+            rolls_surfs = {n: small_font.render(f"Rolls Left: {n}", True, BLACK)
+                           for n in range(MAX_ROLLS_PER_TURN + 1)}
+            help_surf_roll = small_font.render("Press R to roll, E to end turn.", True, BLACK)
+            help_surf_keep = small_font.render("Click a die to keep/unkeep it.", True, BLACK)
+
             # During a turn, the player can roll up to MAX_ROLLS_PER_TURN times
             while not turn_ended:
-                for event in pygame.event.get():
+                # Draw the rolling screen (only when something changed)
+                if needs_redraw:
+                    screen.blit(ROLLING_BG, (0, 0))
+
+                    text_x = STATUS_BOX_RECT.x + 20
+                    text_y = STATUS_BOX_RECT.y + 20
+                    screen.blit(header_surf, (text_x, text_y))
+                    screen.blit(rolls_surfs[rolls_left], (text_x, text_y+30))
+                    screen.blit(help_surf_roll, (text_x, text_y+60))
+                    screen.blit(help_surf_keep, (text_x, text_y+90))
+
+                    # Draw dice in one batch, marking kept dice with a red outline
+                    screen.blits(
+                        [(dice_faces[dice_values[i] - 1], dice_positions[i])
+                         for i in range(NUM_DICE)] +
+                        [(DICE_OUTLINE_SURF, dice_positions[i])
+                         for i in range(NUM_DICE) if dice_kept[i]])
+
+                    pygame.display.flip()
+                    needs_redraw = False
+
+                # If no rolls remain, forcibly end turn
+                if rolls_left == 0:
+                    turn_ended = True
+                    continue
+
+                # Block until input arrives; the screen is static between events
+                events = [pygame.event.wait()] + pygame.event.get(HANDLED_EVENT_TYPES)
+                for event in events:
                     if event.type == pygame.QUIT:
                         pygame.quit()
                         sys.exit()
 
                     if event.type == pygame.KEYDOWN:
+                        needs_redraw = True
                         # Exit if ESCAPE is pressed
                         if event.key == pygame.K_ESCAPE:
                             pygame.quit()
@@ -652,7 +791,8 @@ def main():
                             if rolls_left > 0:
                                 animate_cup_shake(dice_kept, dice_values)
                                 rolls_left -= 1
-                            else:
+                            elif __debug__:
+                                # Console-only diagnostic; stripped under python -O
                                 print("No rolls left this turn.")
 
                         # End turn if 'E' is pressed
@@ -662,49 +802,29 @@ def main():
                     # Click on a die to toggle "keep" status
                     if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                         mouse_pos = event.pos
-                        for i in range(NUM_DICE):
-                            x, y = dice_positions[i]
-                            rect = pygame.Rect(x, y, DICE_FACE_WIDTH, DICE_FACE_HEIGHT)
+                        for i, rect in enumerate(DICE_RECTS):
                             if rect.collidepoint(mouse_pos):
                                 dice_kept[i] = not dice_kept[i]
-
-                # Draw the rolling screen
-                screen.fill(GREEN)
-                box_width, box_height = 600, 150
-                box_x = (WINDOW_WIDTH - box_width)//2
-                box_y = 20
-                pygame.draw.rect(screen, WHITE, (box_x, box_y, box_width, box_height))
-                pygame.draw.rect(screen, BLACK, (box_x, box_y, box_width, box_height), 2)
-
-                text_x = box_x + 20
-                text_y = box_y + 20
-                header = f"Player {current_player+1} - Round {round_num} of {MAX_TURNS}"
-                draw_text(header, text_x, text_y, RED, font_obj=small_font)
-                draw_text(f"Rolls Left: {rolls_left}", text_x, text_y+30, font_obj=small_font)
-                draw_text("Press R to roll, E to end turn.", text_x, text_y+60, font_obj=small_font)
-                draw_text("Click a die to keep/unkeep it.", text_x, text_y+90, font_obj=small_font)
-
-                # Draw dice, marking kept dice with a red outline
-                for i in range(NUM_DICE):
-                    val = dice_values[i]
-                    x, y = dice_positions[i]
-                    screen.blit(dice_faces[val - 1], (x, y))
-                    if dice_kept[i]:
-                        pygame.draw.rect(screen, RED, (x, y, DICE_FACE_WIDTH, DICE_FACE_HEIGHT), 3)
-
-                pygame.display.flip()
-                clock.tick(FPS)
-
-                # If no rolls remain, forcibly end turn
-                if rolls_left == 0:
-                    turn_ended = True
+                                needs_redraw = True
 
             # After the player ends their turn, they must choose a category to score
-            chosen_cat, zero_selected = display_scorecard_options(dice_values, current_player, round_num)
-            apply_score_to_category(chosen_cat, dice_values, current_player, zero_selected)
+            chosen_cat, zero_selected = display_scorecard_options(dice_values, current_player, round_num, state)
+            apply_score_to_category(chosen_cat, dice_values, current_player, state, zero_selected)
 
-    # After all rounds, show the final scores
-    game_over_screen()
+def main():
+    """
+    Outer game loop: prompt for players, play a full game, show the final
+    scores, and start over if the player chooses to play again.
+    """
+    state = None
+    while True:
+        num_players = prompt_player_count()
+        if state is not None and state.num_players == num_players:
+            state.reset()
+        else:
+            state = GameState(num_players)
+        play_game(state)
+        game_over_screen(state)  # Returns when "Play Again" is clicked
 
 # ---------------------------------------------------------------------------
 #                               ENTRY POINT
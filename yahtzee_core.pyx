@@ -0,0 +1,55 @@
+# cython: boundscheck=False, wraparound=False
+"""
+Optional compiled scoring core for the Yahtzee game.
+
+Build in place with:
+    python setup.py build_ext --inplace
+
+yahtzee.py falls back to its pure-Python scoring implementation when this
+module has not been built, so compiling it is never required to play.
+"""
+
+cpdef dict calc_scores(tuple sorted_dice):
+    """
+    Typed version of the scoring core in yahtzee.py: one counting pass over
+    the 5 dice plus a bitmask of present values for straight detection.
+    Takes a sorted tuple of dice values, returns category -> possible score.
+    """
+    cdef int counts[7]
+    cdef int i, d
+    cdef int total = 0, mask = 0
+    cdef int max_count = 0, second_count = 0
+
+    for i in range(7):
+        counts[i] = 0
+    for i in range(5):
+        d = sorted_dice[i]
+        counts[d] += 1
+        mask |= 1 << d
+        total += d
+
+    # Two largest counts: max for n-of-a-kind/yahtzee, second for full house
+    for i in range(1, 7):
+        if counts[i] >= max_count:
+            second_count = max_count
+            max_count = counts[i]
+        elif counts[i] > second_count:
+            second_count = counts[i]
+
+    return {
+        "ones":   counts[1] * 1,
+        "twos":   counts[2] * 2,
+        "threes": counts[3] * 3,
+        "fours":  counts[4] * 4,
+        "fives":  counts[5] * 5,
+        "sixes":  counts[6] * 6,
+        "three_of_a_kind": total if max_count >= 3 else 0,
+        "four_of_a_kind":  total if max_count >= 4 else 0,
+        "full_house": 25 if max_count == 3 and second_count == 2 else 0,
+        "small_straight": 30 if ((mask & 0b0011110) == 0b0011110 or
+                                 (mask & 0b0111100) == 0b0111100 or
+                                 (mask & 0b1111000) == 0b1111000) else 0,
+        "large_straight": 40 if mask == 0b0111110 or mask == 0b1111100 else 0,
+        "yahtzee": 50 if max_count == 5 else 0,
+        "chance": total,
+    }